@@ -58,10 +58,13 @@ def get_server_info() -> dict:
 
 
 # --- 4. Custom Routes (Health Check) ---
+health_response = JSONResponse({"status": "OK", "name": mcp.name})
+
+
 @mcp.custom_route("/health", methods=["GET"])
-def health_check(request: Request) -> JSONResponse:
+async def health_check(request: Request) -> JSONResponse:
     """Standard health check endpoint for monitoring server status."""
-    return JSONResponse({"status": "OK", "name": mcp.name})
+    return health_response
 
 
 # --- 5. Run the Server ---
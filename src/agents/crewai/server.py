@@ -3,9 +3,8 @@ import os
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from starlette.requests import Request
-from starlette.responses import JSONResponse
 
 # Import the new run_agent function
 from src.agents.crewai.agent import run_agent
@@ -14,6 +13,7 @@ app = FastAPI(
     title="CrewAI - Research Report Generation Agent",
     root_path=os.getenv("TFY_SERVICE_ROOT_PATH", ""),
     docs_url="/",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for local development/different origins
@@ -27,10 +27,13 @@ app.add_middleware(
 
 
 # Define Health Check endpoint
+health_response = ORJSONResponse({"status": "OK"})
+
+
 @app.get("/health")
-def status(request: Request) -> JSONResponse:
+async def status() -> ORJSONResponse:
     """Standard health check endpoint for monitoring service status."""
-    return JSONResponse({"status": "OK"})
+    return health_response
 
 
 # Add a Pydantic Model to ensure input types
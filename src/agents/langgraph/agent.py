@@ -1,9 +1,12 @@
 # Import libraries
 import os
 import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
 from dotenv import load_dotenv
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
 from langchain_openai import ChatOpenAI
 from langchain_tavily import TavilySearch
 from langgraph.graph import MessagesState, StateGraph
@@ -12,11 +15,36 @@ from langgraph.graph import MessagesState, StateGraph
 load_dotenv(override=True)
 
 # --- Configuration ---
+# Shared connection pool for all LLM Gateway calls, so concurrent requests reuse
+# warm keep-alive connections instead of each client opening its own.
+# Close it with `await http_client.aclose()` on shutdown.
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0
+    ),
+)
+
+
+async def warm_up_gateway() -> None:
+    """
+    Opens a pooled connection to the LLM Gateway ahead of the first agent run,
+    so DNS lookup and TLS handshake are not paid on the request path. Best effort.
+    """
+    try:
+        await http_client.get(
+            f"{os.getenv('LLM_GATEWAY_URL')}/models",
+            headers={"Authorization": f"Bearer {os.getenv('TFY_API_KEY')}"},
+        )
+    except httpx.HTTPError:
+        pass
+
+
 # 1. Update the LLM initialization for LangGraph with TrueFoundry
 llm_researcher = ChatOpenAI(
     model=os.getenv("LLM_MODEL_RESEARCHER"),
     base_url=os.getenv("LLM_GATEWAY_URL"),
     api_key=os.getenv("TFY_API_KEY"),
+    http_async_client=http_client,
     model_kwargs={
       "stream": False,
       "extra_headers":{
@@ -36,19 +64,35 @@ llm_researcher = ChatOpenAI(
     },
 )
 
-llm_writer = ChatOpenAI(
-    model=os.getenv("LLM_MODEL_WRITER"),
-    base_url=os.getenv("LLM_GATEWAY_URL"),
-    api_key=os.getenv("TFY_API_KEY"),
-    model_kwargs={
-      "stream": False,
-      "extra_headers":{
-        "X-TFY-METADATA": '{}',
-        "X-TFY-LOGGING-CONFIG": '{"enabled": true}',
-      },
-    },
+# --- Prompts ---
+# Built once at import; only the template variables change between requests.
+# Research and report writing are fused into a single LLM call: the model searches
+# through the gateway's web search tool and answers directly with the Markdown report.
+researcher_persona = (
+    "You are a Senior Web Researcher and a meticulous Professional Technical Writer. "
+    "Your goal is to gather the latest and most relevant information about the user's query "
+    "and turn it into polished, production-ready documentation. "
+    "You are an expert at utilizing the web search tool to find real-time, accurate, "
+    "and cited information on any given topic. Your output must be precise and well-structured."
 )
 
+researcher_instruction = """
+        TASK: Conduct an 'advanced' web search for the user's query: '{query}'.
+        Focus on recent developments and list all sources used in the final report.
+
+        Then write a final report for the query, using ONLY the context from web search tool as provided.
+        The report must be in **Markdown format** with a clear title (using #) and bullet points.
+        The final output must be ONLY the Markdown text. Expected output: A comprehensive, cited Markdown formatted report.
+        """
+
+researcher_prompt = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=researcher_persona),
+        HumanMessagePromptTemplate.from_template(researcher_instruction),
+    ]
+)
+researcher_chain = researcher_prompt | llm_researcher
+
 # # --- Tools Setup ---
 # # Tavily Search Tool for web research
 # tavily_tool = TavilySearch(max_results=5)
@@ -62,89 +106,21 @@ class ResearchState(MessagesState):
     """
 
     query: str
-    search_results: str
     final_report: str
 
 
 # --- 3. Agent Functions (Nodes) ---
-def researcher_node(state: ResearchState) -> ResearchState:
+async def researcher_node(state: ResearchState) -> ResearchState:
     """
-    NODE 1: Acts as the Researcher Agent.
+    NODE: Acts as the Researcher and Writer Agent in a single LLM call.
     1. Uses web search tool to find web context based on the query.
-    2. Uses the LLM to summarize and synthesize the raw search results.
-    """
-    print("--- Researcher Node: Gathering Context ---")
-    query = state["query"]
-
-    # 2. LLM Call: Synthesize/Summarize
-    researcher_persona = (
-        "You are a Senior Web Researcher. Your goal is to gather the latest and most relevant "
-        "information about the user's query and format it as a comprehensive summary. "
-        "You are an expert at utilizing the web search tool to find real-time, accurate, "
-        "and cited information on any given topic. Your output must be precise and well-structured."
-    )
-
-    researcher_instruction = f"""
-        TASK: Conduct an 'advanced' web search for the user's query: '{query}'.
-        Focus on recent developments and list all sources used in the final summary.
-
-        The final output MUST be a single, well-structured text summary of findings,
-        using ONLY the context from web search tool as provided. Expected output: A comprehensive, cited summary.
-        """
-
-    researcher_prompt = ChatPromptTemplate.from_messages(
-        [
-            SystemMessage(content=researcher_persona),
-            HumanMessage(content=researcher_instruction),
-        ]
-    )
-
-    summary = researcher_prompt | llm_researcher
-    summary_content = summary.invoke({}).content
-
-    # Update the state with the synthesized context
-    return {"search_context": summary_content}
-
-
-def writer_node(state: ResearchState) -> ResearchState:
-    """
-    NODE 2: Acts as the Writer Agent.
-    Takes the synthesis from the Researcher and formats it into a final Markdown report.
+    2. Synthesizes the search results directly into the final Markdown report.
     """
-    print("--- Writer Node: Generating Final Report ---")
-
-    # Get the synthesized context from the previous node's output in the state
-    summary = state.get("search_context", "No context found.")
+    print("--- Researcher Node: Gathering Context and Generating Final Report ---")
     query = state["query"]
 
-    # LLM Call: Writer
-    writer_persona = (
-        "You are a Professional Technical Writer. You are a meticulous technical writer "
-        "who turns raw research data into polished, production-ready documentation. "
-        "Your goal is to write a final, professionally formatted markdown report based on the context provided."
-    )
-
-    writer_instruction = f"""
-        TASK: Based on the summary provided by the Researcher Agent, write a final report for the query: '{query}'.
-
-        The report must be in **Markdown format** with a clear title (using #) and bullet points.
-        The final output must be ONLY the Markdown text. Expected output: A Markdown formatted report.
-
-        RESEARCH SUMMARY:
-        ---
-        {summary}
-        ---
-        """
-
-    writer_prompt = ChatPromptTemplate.from_messages(
-        [
-            SystemMessage(content=writer_persona),
-            HumanMessage(content=writer_instruction),
-        ]
-    )
-
-    report_chain = writer_prompt | llm_writer
-    final_report_content = report_chain.invoke({}).content
+    # LLM Call: Search, synthesize and write
+    final_report_content = (await researcher_chain.ainvoke({"query": query})).content
 
     # Update the state with the final report (this will be the final output of the graph)
     return {"final_report": final_report_content}
@@ -154,14 +130,12 @@ def writer_node(state: ResearchState) -> ResearchState:
 # # Initialize the StateGraph
 # workflow = StateGraph(ResearchState)
 
-# # Add nodes corresponding to the agents
+# # Add the node corresponding to the agent
 # workflow.add_node("researcher", researcher_node)
-# workflow.add_node("writer", writer_node)
 
-# # Define the sequential edges (Researcher -> Writer -> END)
+# # Define the edges (Researcher -> END)
 # workflow.set_entry_point("researcher")
-# workflow.add_edge("researcher", "writer")
-# workflow.set_finish_point("writer")
+# workflow.set_finish_point("researcher")
 
 # # Compile the graph
 # app = workflow.compile()
@@ -170,9 +144,8 @@ def writer_node(state: ResearchState) -> ResearchState:
 app = (
     StateGraph(ResearchState)
     .add_node("researcher", researcher_node)
-    .add_node("writer", writer_node)
     .add_edge("__start__", "researcher")
-    .add_edge("researcher", "writer")
+    .set_finish_point("researcher")
     .compile(name="Basic Graph")
 )
 
@@ -185,7 +158,6 @@ async def run_agent(query: str) -> str:
     """
     initial_state = {
         "query": query,
-        "search_context": "",
         "final_report": "",
         "messages": [HumanMessage(content=query)],
     }
@@ -197,6 +169,53 @@ async def run_agent(query: str) -> str:
     return final_state["final_report"]
 
 
+async def stream_agent(query: str) -> AsyncIterator[str]:
+    """
+    Executes the compiled LangGraph workflow and yields the final report token by token
+    as the Researcher node generates it.
+    """
+    initial_state = {
+        "query": query,
+        "final_report": "",
+        "messages": [HumanMessage(content=query)],
+    }
+
+    async for event in app.astream_events(initial_state, version="v2"):
+        if (
+            event["event"] == "on_chat_model_stream"
+            and event["metadata"].get("langgraph_node") == "researcher"
+            and event["data"]["chunk"].content
+        ):
+            yield event["data"]["chunk"].content
+
+
+# --- Batch Execution ---
+# Upper bound on graph runs in flight at once. Size it to the LLM Gateway's rate limit.
+max_concurrent_runs = asyncio.Semaphore(int(os.getenv("AGENT_MAX_CONCURRENCY", "8")))
+
+
+async def run_agent_batch(queries: list[str]) -> list[str]:
+    """
+    Executes the workflow for several queries concurrently.
+    Reports are returned in the same order as the queries. A query that fails gets an
+    error message in its slot, without discarding the reports of the other queries.
+    """
+
+    async def run_bounded(query: str) -> str:
+        async with max_concurrent_runs:
+            return await run_agent(query)
+
+    results = await asyncio.gather(
+        *(run_bounded(query) for query in queries), return_exceptions=True
+    )
+    return [
+        f"Error: Could not complete the workflow for this query. Details: {result}"
+        if isinstance(result, Exception)
+        else result
+        for result in results
+    ]
+
+
 if __name__ == "__main__":
     # Example Query
     query = "Latest developments in quantum computing hardware in 2026"
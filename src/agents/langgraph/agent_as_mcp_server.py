@@ -8,7 +8,7 @@ from mcp.server.fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from src.agents.langgraph.agent import run_agent
+from src.agents.langgraph.agent import run_agent, run_agent_batch
 
 # --- 1. FastMCP Initialization and Configuration ---
 # Initialize the server. Authentication logic can be added here if desired.
@@ -21,8 +21,8 @@ mcp = FastMCP(
 @mcp.tool()
 async def conduct_research_and_report(query: str) -> str:
     """
-    Executes a two-agent workflow to perform real-time web research (via Tavily),
-    and generate a detailed report in a Markdown format.
+    Executes a research workflow to perform real-time web research (via the web search tool),
+    and generate a detailed report in a Markdown format, in a single LLM call.
 
     This is the complete research-to-delivery action.
 
@@ -45,6 +45,21 @@ async def conduct_research_and_report(query: str) -> str:
         return f"Tool Execution Error: Could not complete the workflow. Details: {e}"
 
 
+@mcp.tool()
+async def conduct_batch_research_and_report(queries: list[str]) -> list[str]:
+    """
+    Executes the research-to-report workflow for several topics concurrently.
+
+    Args:
+        queries (list[str]): The research topics, one report is generated per topic.
+
+    Returns:
+        list[str]: One entry per query, in the same order: the generated report, or a
+            detailed error message if the workflow failed for that query.
+    """
+    return await run_agent_batch(queries)
+
+
 # --- 3. Defining Resources (Server Context) ---
 @mcp.resource("config://server-info")
 def get_server_info() -> dict:
@@ -52,16 +67,19 @@ def get_server_info() -> dict:
     return {
         "server_name": mcp.name,
         "description": "Exposes the research and report generation agent.",
-        "tool_flow": "TavilySearch -> LLM Summary -> FileWriteTool",
+        "tool_flow": "Web Search -> LLM Report",
         "output_file": "research_report.md",
     }
 
 
 # --- 4. Custom Routes (Health Check) ---
+health_response = JSONResponse({"status": "OK", "name": mcp.name})
+
+
 @mcp.custom_route("/health", methods=["GET"])
-def health_check(request: Request) -> JSONResponse:
+async def health_check(request: Request) -> JSONResponse:
     """Standard health check endpoint for monitoring server status."""
-    return JSONResponse({"status": "OK", "name": mcp.name})
+    return health_response
 
 
 # --- 5. Run the Server ---
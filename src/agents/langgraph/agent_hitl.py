@@ -1,12 +1,13 @@
 #Import libraries
 import os, uuid
 import sqlite3
+import time
 from typing import TypedDict, Annotated, Literal, List
 from langchain_openai import ChatOpenAI
 from langchain_tavily import TavilySearch
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
-from langgraph.graph import add_messages, StateGraph, END, MessagesState
+from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
+from langchain_core.messages import SystemMessage
+from langgraph.graph import StateGraph, END, MessagesState
 from langgraph.types import Command, interrupt
 from dotenv import load_dotenv
 
@@ -26,7 +27,106 @@ llm = ChatOpenAI(
 tavily_tool = TavilySearch(max_results=5)
 tools = [tavily_tool]
 
+# --- Search Cache ---
+# Formatted search context is reused for up to SEARCH_CACHE_TTL seconds per query,
+# so feedback loops on an unchanged query only re-prompt the LLM.
+SEARCH_CACHE_TTL = 900
+SEARCH_CACHE_SIZE = 1024
+# Normalized query -> (time fetched, formatted search context)
+_search_cache: dict[str, tuple[float, str]] = {}
+
+
+def search_web(query: str) -> str:
+    """
+    Returns the formatted web search context for a query, served from cache when fresh.
+    Only the cache key is normalized; Tavily always receives the query as the user wrote it.
+    """
+    key = query.strip().lower()
+    now = time.monotonic()
+    cached = _search_cache.get(key)
+    if cached is not None and now - cached[0] < SEARCH_CACHE_TTL:
+        return cached[1]
+
+    search_context = tavily_tool.invoke({"query": query})
+    formatted_context = "\n\n".join(
+        "Source: " + r["url"] + "\nTitle: " + r["title"] + "\nSnippet: " + r["content"][:300] + "..."
+        for r in search_context["results"]
+    )
+
+    # Evict the oldest entry once full (dicts keep insertion order)
+    _search_cache.pop(key, None)
+    if len(_search_cache) >= SEARCH_CACHE_SIZE:
+        _search_cache.pop(next(iter(_search_cache)), None)
+    _search_cache[key] = (now, formatted_context)
+    return formatted_context
+
+# --- Prompts ---
+# Built once at import; only the template variables change between requests
+researcher_persona = (
+    "You are a Senior Web Researcher. Your goal is to gather the latest and most relevant "
+    "information about the user's query and format it as a comprehensive summary. "
+    "You are an expert at utilizing the Tavily web search tool to find real-time, accurate, "
+    "and cited information on any given topic. Your output must be precise and well-structured."
+)
+
+researcher_instruction = """
+        TASK: Conduct an 'advanced' web search for the user's query: '{query}'. 
+
+        Human Feedback: {feedback}
+
+        Focus on recent developments and list all sources used in the final summary. 
+        
+        Consider previous human feedback to refine the reponse.
+        
+        The final output MUST be a single, well-structured text summary of findings, 
+        using ONLY the context provided below. Expected output: A comprehensive, cited summary.
+
+        RESEARCH CONTEXT:
+        ---
+        {context}
+        ---
+        """
+
+researcher_prompt = ChatPromptTemplate.from_messages([
+    SystemMessage(content=researcher_persona),
+    HumanMessagePromptTemplate.from_template(researcher_instruction)
+])
+researcher_chain = researcher_prompt | llm
+
+writer_persona = (
+    "You are a Professional Technical Writer. You are a meticulous technical writer "
+    "who turns raw research data into polished, production-ready documentation. "
+    "Your goal is to write a final, professionally formatted markdown report based on the context provided."
+)
+
+writer_instruction = """
+        TASK: Based on the summary provided by the Researcher Agent, write a final report for the query: '{query}'.
+        
+        The report must be in **Markdown format** with a clear title (using #) and bullet points.
+        The final output must be ONLY the Markdown text. Expected output: A Markdown formatted report.
+
+        RESEARCH SUMMARY:
+        ---
+        {summary}
+        ---
+        """
+
+writer_prompt = ChatPromptTemplate.from_messages([
+    SystemMessage(content=writer_persona),
+    HumanMessagePromptTemplate.from_template(writer_instruction)
+])
+writer_chain = writer_prompt | llm
+
 # --- 2. Shared Graph State ---
+# Only the most recent feedback is kept so checkpoints stay small on long feedback loops
+MAX_FEEDBACK_HISTORY = 3
+
+
+def keep_recent_feedback(existing: List[str], new: List[str]) -> List[str]:
+    """Reducer that appends new feedback and keeps only the latest MAX_FEEDBACK_HISTORY entries."""
+    return (existing + new)[-MAX_FEEDBACK_HISTORY:]
+
+
 class ResearchState(MessagesState):
     """
     Represents the state of our multi-step research process.
@@ -34,8 +134,8 @@ class ResearchState(MessagesState):
     """
 
     query: str
-    search_context: Annotated[List[str], add_messages] #every time the model returns search results - CHANGED
-    human_feedback: Annotated[List[str], add_messages] #every time there's a feedback - CHANGED
+    search_context: str #latest summary only, the writer never needs earlier iterations
+    human_feedback: Annotated[List[str], keep_recent_feedback] #last few rounds of feedback
     final_report: str
 
 
@@ -51,54 +151,23 @@ def researcher_node(state: ResearchState) -> ResearchState:
     query = state["query"]
     feedback = state["human_feedback"] if "human_feedback" in state else ["No Feedback yet"] ##Adding human feedback
     
-    # 1. Tool Call: Tavily Search
-    search_context = tavily_tool.invoke({"query": query})
-    # Format the search results cleanly
-    context_string = "\n\n".join(
-        [f"Source: {r['url']}\nTitle: {r['title']}\nSnippet: {r['content'][:300]}..." for r in search_context["results"]]
-    )
+    # 1. Tool Call: Tavily Search (cached per query, formatted cleanly)
+    context_string = search_web(query)
 
    # 2. LLM Call: Synthesize/Summarize
-    researcher_persona = (
-        "You are a Senior Web Researcher. Your goal is to gather the latest and most relevant "
-        "information about the user's query and format it as a comprehensive summary. "
-        "You are an expert at utilizing the Tavily web search tool to find real-time, accurate, "
-        "and cited information on any given topic. Your output must be precise and well-structured."
-    )
-    
-    researcher_instruction = (
-        f"""
-        TASK: Conduct an 'advanced' web search for the user's query: '{query}'. 
-
-        Human Feedback: {feedback[-1] if feedback else "No feedback yet"}
-
-        Focus on recent developments and list all sources used in the final summary. 
-        
-        Consider previous human feedback to refine the reponse.
-        
-        The final output MUST be a single, well-structured text summary of findings, 
-        using ONLY the context provided below. Expected output: A comprehensive, cited summary.
-
-        RESEARCH CONTEXT:
-        ---
-        {context_string}
-        ---
-        """
-    )
-    
-    researcher_prompt = ChatPromptTemplate.from_messages([
-        SystemMessage(content=researcher_persona),
-        HumanMessage(content=researcher_instruction)
-    ])
-    
-    summary = researcher_prompt | llm
-    summary_content = summary.invoke({}).content
+    summary_content = researcher_chain.invoke(
+        {
+            "query": query,
+            "feedback": feedback[-1] if feedback else "No feedback yet",
+            "context": context_string,
+        }
+    ).content
     
     print(f"[researcher_node] Generated summary:\n{summary_content}\n")
 
     
     # Update the state with the synthesized context
-    return {"search_context": [AIMessage(content=summary_content)]}
+    return {"search_context": summary_content}
 
 def human_node(state: ResearchState) -> ResearchState: 
     """Human Intervention node - loops back to model unless input is done"""
@@ -120,10 +189,10 @@ def human_node(state: ResearchState) -> ResearchState:
 
     # If user types "done", transition to END node
     if user_feedback.lower() == "done": 
-        return Command(update={"human_feedback": state["human_feedback"] + ["Finalised"]}, goto="writer")
+        return Command(update={"human_feedback": ["Finalised"]}, goto="writer")
 
     # Otherwise, update feedback and return to model for re-generation
-    return Command(update={"human_feedback": state["human_feedback"] + [user_feedback]}, goto="researcher")
+    return Command(update={"human_feedback": [user_feedback]}, goto="researcher")
     
 def writer_node(state: ResearchState) -> ResearchState:
     """
@@ -137,33 +206,7 @@ def writer_node(state: ResearchState) -> ResearchState:
     query = state["query"]
 
     # LLM Call: Writer
-    writer_persona = (
-        "You are a Professional Technical Writer. You are a meticulous technical writer "
-        "who turns raw research data into polished, production-ready documentation. "
-        "Your goal is to write a final, professionally formatted markdown report based on the context provided."
-    )
-
-    writer_instruction = (
-        f"""
-        TASK: Based on the summary provided by the Researcher Agent, write a final report for the query: '{query}'.
-        
-        The report must be in **Markdown format** with a clear title (using #) and bullet points.
-        The final output must be ONLY the Markdown text. Expected output: A Markdown formatted report.
-
-        RESEARCH SUMMARY:
-        ---
-        {summary}
-        ---
-        """
-    )
-
-    writer_prompt = ChatPromptTemplate.from_messages([
-        SystemMessage(content=writer_persona),
-        HumanMessage(content=writer_instruction)
-    ])
-
-    report_chain = writer_prompt | llm
-    final_report_content = report_chain.invoke({}).content
+    final_report_content = writer_chain.invoke({"query": query, "summary": summary}).content
     
     # Update the state with the final report (this will be the final output of the graph)
     return {"final_report": final_report_content}
@@ -1,19 +1,39 @@
 """FastAPI backend for Research Report Generation."""
+import asyncio
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import StreamingResponse
 
 # Import the new run_agent function
-from src.agents.langgraph.agent import run_agent
+from src.agents.langgraph.agent import (
+    http_client,
+    run_agent_batch,
+    stream_agent,
+    warm_up_gateway,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warms up the agent's shared LLM Gateway connection pool and releases it on shutdown."""
+    # Run in the background so startup is not blocked on the gateway round-trip
+    warm_up = asyncio.create_task(warm_up_gateway())
+    yield
+    warm_up.cancel()
+    await http_client.aclose()
+
 
 app = FastAPI(
     title="LangGraph - Research Report Generation Agent",
     root_path=os.getenv("TFY_SERVICE_ROOT_PATH", ""),
     docs_url="/",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware for local development/different origins
@@ -27,10 +47,13 @@ app.add_middleware(
 
 
 # Define Health Check endpoint
+health_response = ORJSONResponse({"status": "OK"})
+
+
 @app.get("/health")
-def status(request: Request) -> JSONResponse:
+async def status() -> ORJSONResponse:
     """Standard health check endpoint for monitoring service status."""
-    return JSONResponse({"status": "OK"})
+    return health_response
 
 
 # Add a Pydantic Model to ensure input types
@@ -42,8 +65,28 @@ class UserInput(BaseModel):
 
 # Primary FastAPI endpoint
 @app.post("/chat")
-async def run_agent_endpoint(user_input: UserInput):
+async def run_agent_endpoint(user_input: UserInput) -> StreamingResponse:
+    """
+    Receives user input and executes the agent, streaming the report back as it is written.
+    """
+    report = stream_agent(user_input.user_input)
+    # Wait for the first token before sending headers, so a run that fails before
+    # writing anything still surfaces as a 500 instead of an empty 200
+    first_chunk = await anext(report, "")
+
+    async def stream_report():
+        yield first_chunk
+        async for chunk in report:
+            yield chunk
+
+    return StreamingResponse(stream_report(), media_type="text/plain; charset=utf-8")
+
+
+# Batch endpoint: runs one workflow per query concurrently
+@app.post("/batch")
+async def run_agent_batch_endpoint(user_inputs: list[str]) -> list[str]:
     """
-    Receives user input and executes the agent to provide a response.
+    Receives a list of user inputs and executes the agent for each of them concurrently.
+    A failed query yields an error message in its slot instead of failing the whole batch.
     """
-    return await run_agent(user_input.user_input)
+    return await run_agent_batch(user_inputs)
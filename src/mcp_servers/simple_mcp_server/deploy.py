@@ -21,8 +21,8 @@ service = Service(
         ),
     ),
     resources=Resources(
-        cpu_request=0.5,
-        cpu_limit=0.5,
+        cpu_request=1.0,
+        cpu_limit=2.0,
         memory_request=1000,
         memory_limit=1000,
         ephemeral_storage_request=500,
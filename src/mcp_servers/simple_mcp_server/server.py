@@ -5,6 +5,7 @@ This server exposes tools for converting news articles to bullet points and othe
 """
 
 import re
+from functools import lru_cache
 
 from mcp.server.fastmcp import FastMCP
 from starlette.requests import Request
@@ -13,8 +14,78 @@ from starlette.responses import JSONResponse
 # --- 1. FastMCP Initialization and Configuration ---
 mcp = FastMCP("news_processing_service", stateless_http=True)
 
+# Regex patterns are compiled once at import and shared by all tool calls
+# Sentence patterns carry the minimum length of each tool, so short fragments are
+# rejected by the regex engine and never reach Python
+_BULLET_SENTENCE_RE = re.compile(r"[^.!?]{21,}")  # more than 20 characters
+_SUMMARY_SENTENCE_RE = re.compile(r"[^.!?]{16,}")  # more than 15 characters
+_WS = re.compile(r"\s+")
+# Dates are matched in ASCII mode to skip Unicode class lookups. The number pattern
+# stays Unicode-aware so NBSP and narrow NBSP between a figure and its unit still match.
+_DATE_RE = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{4}\b", re.ASCII)
+_NUMBER_RE = re.compile(
+    r"\b\d+(?:,\d{3})*(?:\.\d+)?\s*(?:percent|%|million|billion|thousand|dollars?|\$)\b",
+    re.IGNORECASE,
+)
+_QUOTE_RE = re.compile(r'"([^"]+)"')
+
+# Tool results and sentence splits are memoized for inputs shorter than this;
+# longer texts bypass the caches
+_MAX_CACHED_TEXT_LENGTH = 64_000
+
+
+def _split_sentences(text: str, sentence_re, min_length: int) -> tuple[str, ...]:
+    """
+    Splits text into stripped sentences, keeping only those longer than min_length.
+    sentence_re only yields runs longer than min_length, so just the surrounding
+    whitespace is left to check after stripping.
+    """
+    return tuple(
+        sentence
+        for run in sentence_re.findall(text)
+        if len(sentence := run.strip()) > min_length
+    )
+
+
+_split_sentences_cached = lru_cache(maxsize=128)(_split_sentences)
+
+
+def _extract_sentences(text: str, sentence_re, min_length: int) -> tuple[str, ...]:
+    """
+    Returns the sentences of text longer than min_length. The split is cached across
+    tools, so chaining several of them on one article splits it only once per pattern.
+    """
+    if len(text) < _MAX_CACHED_TEXT_LENGTH:
+        return _split_sentences_cached(text, sentence_re, min_length)
+    return _split_sentences(text, sentence_re, min_length)
+
 
 # --- 2. Defining Tools ---
+def _convert_to_bullet_points(text: str, max_points: int) -> str:
+    """Uncached implementation of the convert_to_bullet_points tool."""
+    if not text or not text.strip():
+        return "No content provided to convert to bullet points."
+
+    # Clean and split the text into sentences
+    sentences = _extract_sentences(text, _BULLET_SENTENCE_RE, 20)
+
+    if not sentences:
+        return "• Unable to extract meaningful content for bullet points."
+
+    # Limit the number of points
+    sentences = sentences[:max_points]
+
+    if not sentences:
+        return "• No valid content found to convert to bullet points."
+
+    # Create bullet points, collapsing internal whitespace including line breaks.
+    # Sentences are already stripped and non-empty, so no bullet can end up blank.
+    return "\n".join("• " + _WS.sub(" ", sentence) for sentence in sentences)
+
+
+_convert_to_bullet_points_cached = lru_cache(maxsize=256)(_convert_to_bullet_points)
+
+
 @mcp.tool()
 def convert_to_bullet_points(text: str, max_points: int = 10) -> str:
     """
@@ -27,37 +98,33 @@ def convert_to_bullet_points(text: str, max_points: int = 10) -> str:
     Returns:
         str: Formatted bullet points with proper markdown formatting.
     """
-    try:
-        if not text or not text.strip():
-            return "No content provided to convert to bullet points."
+    if len(text) < _MAX_CACHED_TEXT_LENGTH:
+        return _convert_to_bullet_points_cached(text, max_points)
+    return _convert_to_bullet_points(text, max_points)
 
-        # Clean and split the text into sentences
-        sentences = re.split(r"[.!?]+", text)
-        sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 20]
 
-        if not sentences:
-            return "• Unable to extract meaningful content for bullet points."
+def _summarize_news_article(article_text: str, summary_length: str) -> str:
+    """Uncached implementation of the summarize_news_article tool."""
+    if not article_text or not article_text.strip():
+        return "No article content provided for summarization."
 
-        # Limit the number of points
-        sentences = sentences[:max_points]
+    # Simple extractive summarization by taking first few sentences
+    sentences = _extract_sentences(article_text, _SUMMARY_SENTENCE_RE, 15)
 
-        # Create bullet points
-        bullet_points = []
-        for i, sentence in enumerate(sentences, 1):
-            # Clean up the sentence
-            sentence = sentence.replace("\n", " ").replace("\r", " ")
-            sentence = re.sub(r"\s+", " ", sentence).strip()
+    if not sentences:
+        return "Unable to extract meaningful content for summarization."
 
-            if sentence:
-                bullet_points.append(f"• {sentence}")
+    # Determine number of sentences based on summary length (medium or unknown: 4)
+    num_sentences = (
+        2 if summary_length == "short" else 6 if summary_length == "long" else 4
+    )
 
-        if not bullet_points:
-            return "• No valid content found to convert to bullet points."
+    # Take the first N sentences as summary. Sentences never contain terminators
+    # and at least one is kept, so the closing period is always needed.
+    return ". ".join(sentences[:num_sentences]) + "."
 
-        return "\n".join(bullet_points)
 
-    except Exception as e:
-        return f"Error converting to bullet points: {str(e)}"
+_summarize_news_article_cached = lru_cache(maxsize=256)(_summarize_news_article)
 
 
 @mcp.tool()
@@ -72,32 +139,48 @@ def summarize_news_article(article_text: str, summary_length: str = "medium") ->
     Returns:
         str: A concise summary of the article.
     """
-    try:
-        if not article_text or not article_text.strip():
-            return "No article content provided for summarization."
-
-        # Simple extractive summarization by taking first few sentences
-        sentences = re.split(r"[.!?]+", article_text)
-        sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 15]
-
-        if not sentences:
-            return "Unable to extract meaningful content for summarization."
-
-        # Determine number of sentences based on summary length
-        length_map = {"short": 2, "medium": 4, "long": 6}
-        num_sentences = length_map.get(summary_length, 4)
-
-        # Take the first N sentences as summary
-        summary_sentences = sentences[:num_sentences]
-        summary = ". ".join(summary_sentences)
-
-        if summary and not summary.endswith("."):
-            summary += "."
+    if len(article_text) < _MAX_CACHED_TEXT_LENGTH:
+        return _summarize_news_article_cached(article_text, summary_length)
+    return _summarize_news_article(article_text, summary_length)
+
+
+def _extract_key_facts(text: str) -> str:
+    """Uncached implementation of the extract_key_facts tool."""
+    if not text or not text.strip():
+        return "No content provided to extract facts from."
+
+    # Look for patterns that indicate facts (numbers, dates, names, etc.)
+    facts = []
+
+    # Extract dates (deduplicated in order of first mention)
+    dates = _DATE_RE.findall(text)
+    if dates:
+        facts.append(f"• Dates mentioned: {', '.join(dict.fromkeys(dates))}")
+
+    # Extract numbers that might be statistics
+    numbers = _NUMBER_RE.findall(text)
+    if numbers:
+        facts.append(f"• Key statistics: {', '.join(dict.fromkeys(numbers))}")
+
+    # Extract the first quoted statement; search stops scanning at the first match
+    quote = _QUOTE_RE.search(text)
+    if quote:
+        facts.append(f"• Notable quotes: {quote.group(1)}")
+
+    if not facts:
+        # Fallback: extract first few sentences as key points
+        sentences = _extract_sentences(text, _BULLET_SENTENCE_RE, 20)
+        if sentences:
+            facts = [f"• {sentence}" for sentence in sentences[:3]]
+
+    return (
+        "\n".join(facts)
+        if facts
+        else "• No specific facts could be extracted from the content."
+    )
 
-        return summary
 
-    except Exception as e:
-        return f"Error summarizing article: {str(e)}"
+_extract_key_facts_cached = lru_cache(maxsize=256)(_extract_key_facts)
 
 
 @mcp.tool()
@@ -111,48 +194,9 @@ def extract_key_facts(text: str) -> str:
     Returns:
         str: Key facts formatted as a list.
     """
-    try:
-        if not text or not text.strip():
-            return "No content provided to extract facts from."
-
-        # Look for patterns that indicate facts (numbers, dates, names, etc.)
-        facts = []
-
-        # Extract dates
-        date_pattern = r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{4}\b"
-        dates = re.findall(date_pattern, text)
-        if dates:
-            facts.append(f"• Dates mentioned: {', '.join(set(dates))}")
-
-        # Extract numbers that might be statistics
-        number_pattern = r"\b\d+(?:,\d{3})*(?:\.\d+)?\s*(?:percent|%|million|billion|thousand|dollars?|\$)\b"
-        numbers = re.findall(number_pattern, text, re.IGNORECASE)
-        if numbers:
-            facts.append(f"• Key statistics: {', '.join(set(numbers))}")
-
-        # Extract quoted statements
-        quote_pattern = r'"([^"]+)"'
-        quotes = re.findall(quote_pattern, text)
-        if quotes:
-            facts.append(f"• Notable quotes: {quotes[0]}")  # Take first quote
-
-        if not facts:
-            # Fallback: extract first few sentences as key points
-            sentences = re.split(r"[.!?]+", text)
-            sentences = [
-                s.strip() for s in sentences if s.strip() and len(s.strip()) > 20
-            ]
-            if sentences:
-                facts = [f"• {sentence}" for sentence in sentences[:3]]
-
-        return (
-            "\n".join(facts)
-            if facts
-            else "• No specific facts could be extracted from the content."
-        )
-
-    except Exception as e:
-        return f"Error extracting facts: {str(e)}"
+    if len(text) < _MAX_CACHED_TEXT_LENGTH:
+        return _extract_key_facts_cached(text)
+    return _extract_key_facts(text)
 
 
 # --- 3. Defining Resources (Server Info) ---
@@ -173,13 +217,23 @@ def get_server_info() -> dict:
 
 
 # --- 4. Custom Routes (Health Check) ---
+health_response = JSONResponse({"status": "OK", "name": mcp.name})
+
+
 @mcp.custom_route("/health", methods=["GET"])
-def health_check(request: Request) -> JSONResponse:
+async def health_check(request: Request) -> JSONResponse:
     """Basic liveness probe endpoint for container monitoring."""
-    return JSONResponse({"status": "OK", "name": mcp.name})
+    return health_response
+
+
+# --- 5. ASGI App ---
+# Streamable HTTP app for multi-process serving, e.g.
+# `uvicorn src.mcp_servers.simple_mcp_server.server:app --workers 2`.
+# Stateless HTTP mode means any worker can serve any request.
+app = mcp.streamable_http_app()
 
 
-# --- 5. Run the Server ---
+# --- 6. Run the Server (single process, for local development) ---
 if __name__ == "__main__":
     mcp.settings.host = "0.0.0.0"
     mcp.settings.port = 8000